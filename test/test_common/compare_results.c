@@ -57,11 +57,11 @@ int main( const int argc, const char *argv[] ) {
 
   while( 1 ) {
     for( int i = 0; i < n_col; ++i ) {
-      double val1, val2;
+      double val1, val2, diff;
       fscanf( file1, "%lg%*c", &val1 );
       fscanf( file2, "%lg%*c", &val2 );
-      if( fabs( val1 - val2 ) > abs_tol &&
-          fabs( val1 - val2 ) * 2.0 / fabs( val1 + val2 ) > rel_tol ) {
+      diff = fabs( val1 - val2 );
+      if( diff > abs_tol && diff * 2.0 / fabs( val1 + val2 ) > rel_tol ) {
         printf( "\n\ndata mismatch %lg %lg\n", val1, val2 );
         exit( EXIT_FAILURE );
       }